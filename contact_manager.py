@@ -1,17 +1,99 @@
 import json
-import re
 import os
-from tabulate import tabulate
+import sys
+import string
+from collections import Counter, defaultdict
+from contextlib import contextmanager
 from colorama import init, Fore
 
-#initialize colorama
-init()
+try:
+    import orjson
+except ImportError:  #orjson is optional, the standard json module is used when it is missing
+    orjson = None
+
+try:
+    import ahocorasick
+except ImportError:  #pyahocorasick is optional, bulk_search falls back to one scan per query when it is missing
+    ahocorasick = None
+
+#colors are only used on a terminal: when the output is piped or redirected, colorama is not initialized
+#and text is printed without ANSI codes
+_USE_COLOR = sys.stdout is not None and sys.stdout.isatty()
+if _USE_COLOR:
+    init()
+
+#JSON encoding of the records in the contacts file: orjson when available, otherwise compact standard json
+if orjson is not None:
+    def _dumps(record):
+        return orjson.dumps(record).decode()
+    _loads = orjson.loads
+else:
+    def _dumps(record):
+        return json.dumps(record, separators=(',', ':'))
+    _loads = json.loads
+
+#translation tables used by the validators: each one deletes the characters a field is allowed to contain,
+#so a value is valid when nothing is left over
+_NAME_TABLE = str.maketrans('', '', string.ascii_letters + string.whitespace)
+_PHONE_TABLE = str.maketrans('', '', string.digits)
+_EMAIL_TABLE = str.maketrans('', '', '._-')
+_TLD_TABLE = str.maketrans('', '', '_')
+
+#the contacts file is compacted once it holds more tombstones than this (and more than live contacts)
+_COMPACT_THRESHOLD = 100
+
+#terminal colors accepted by print_in_color
+_COLOR_MAP = {
+    'yellow': Fore.YELLOW,
+    'red': Fore.RED,
+    'green': Fore.GREEN,
+    'blue': Fore.BLUE,
+}
+
+#main menu, composed once and printed with a single call on every loop iteration
+_MENU_LINES = [
+    "\n" + "="*45,
+    "   ContactEase - Contact Management System",
+    "="*45,
+    "1. Add Contact",
+    "2. View Contacts",
+    "3. Modify Contact",
+    "4. Delete Contact",
+    "5. Search Contact",
+    "6. Exit",
+    "="*45,
+    "Enter your choice (1-6): ",
+]
+_MENU = "\n".join(_MENU_LINES)
+if _USE_COLOR:
+    _MENU = Fore.YELLOW + _MENU + Fore.RESET
+
+def _is_legacy_file(file):
+    """
+    Returns True if the open file uses the former format, a single JSON array of contacts, and rewinds it.
+    """
+    legacy = False
+    for line in file:
+        stripped = line.lstrip()
+        if stripped:
+            legacy = stripped.startswith("[")
+            break
+    file.seek(0)
+    return legacy
+
+def _is_word(text):
+    """
+    Returns True if the text is empty or made only of letters and digits.
+    """
+    return not text or text.isalnum()
 
 class Contact:
     """
     A class to represent a contact.
     """
 
+    __slots__ = ("first_name", "last_name", "phone_number", "email", "_search_blob")
+
     def __init__(self, first_name, last_name, phone_number, email):
         """
         Constructs all the necessary attributes for the contact object.
@@ -31,6 +113,13 @@ class Contact:
         self.last_name = last_name
         self.phone_number = phone_number
         self.email = email
+        self._update_search_blob()
+
+    def _update_search_blob(self):
+        """
+        Rebuilds the lowercase text searched by `ContactManager.search_contact`. Must be called after any field changes.
+        """
+        self._search_blob = f"{self.first_name}\x00{self.last_name}\x00{self.phone_number}\x00{self.email}".lower()
 
     def __str__(self):
         """
@@ -38,51 +127,227 @@ class Contact:
         """
         return f"{self.first_name} {self.last_name}, Phone: {self.phone_number}, Email: {self.email}"
 
+    def to_dict(self):
+        """
+        Returns the contact fields as a dictionary, in the format stored in the contacts file.
+        """
+        return {
+            'first_name': self.first_name,
+            'last_name': self.last_name,
+            'phone_number': self.phone_number,
+            'email': self.email,
+        }
+
+    def key(self):
+        """
+        Returns the tuple of fields that identifies the contact when looking for duplicates.
+        """
+        return (self.first_name, self.last_name, self.phone_number, self.email)
+
 class ContactManager:
     """
     A class to manage contacts.
     """
 
-    def __init__(self, filename="contacts.json"):
+    def __init__(self, filename="contacts.jsonl"):
         """
         Constructs all the necessary attributes for the contact manager.
         
         Parameters:
         -----------
         filename : str, optional
-            The name of the file to save and load contacts from (default is "contacts.json").
+            The name of the file to save and load contacts from (default is "contacts.jsonl").
         """
         self.filename = filename
         self.contacts = []
+        self._keys = Counter()  # contact key -> number of contacts sharing it
+        self._blobs = []  # search blobs, parallel to self.contacts
+        self._tombstones = 0  # deletion records in the file since the last compaction
+        self._rewrite_needed = False  # the file could not be fully read, so it must be rewritten before appending
+        self._buffering = 0  # nesting depth of `buffered()` blocks
+        self._pending = []  # records waiting to be appended when buffering ends
+        self._dirty = False  # a full rewrite was requested while buffering
+        self._sorted_cache = []  # contacts in display order
+        self._sorted_dirty = True  # the contacts changed since _sorted_cache was built
         self.load_contacts()
 
     def load_contacts(self):
         """
         Loads contacts from the file.
-        """
+
+        The file holds one JSON record per line: either a contact, or a tombstone `{"op": "del", "key": [...]}`
+        removing one contact with that key. The file is parsed and replayed one line at a time, without reading it
+        into memory as a whole, and it is compacted if too many tombstones have piled up.
+
+        Unreadable lines, such as the partial record an interrupted write leaves behind, are skipped with a
+        warning, and the file is rewritten in full before the next change is saved. The same rewrite happens when
+        the file does not end with a newline, so that an appended record never lands on the last line.
+
+        A file in the former format, a single JSON array of contacts, is still read and is converted on the next
+        save. If the file does not exist but a former `contacts.json` sits next to it, that file is loaded and
+        saved once in the new format.
+        """
+        live = {}  # line number -> contact, in file order
+        positions = defaultdict(list)  # contact key -> line numbers of its live copies
+        bad_lines = []
+        ends_with_newline = True
+        self._tombstones = 0
+        self._rewrite_needed = False
+        filename = self.filename
+        migrating = False
+        legacy_filename = os.path.splitext(filename)[0] + ".json"
+        if filename.endswith(".jsonl") and not os.path.exists(filename) and os.path.exists(legacy_filename):
+            filename = legacy_filename
+            migrating = True
         try:
-            with open(self.filename, "r") as file:
-                contacts_data = json.load(file)
-                self.contacts = [Contact(**data) for data in contacts_data]
+            with open(filename, "r", encoding="utf-8") as file:
+                if _is_legacy_file(file):
+                    self._load_legacy_contacts(file)
+                    if migrating:
+                        self.save_contacts()
+                    return
+                for number, line in enumerate(file):
+                    if not line.strip():
+                        continue
+                    ends_with_newline = line.endswith("\n")
+                    try:
+                        record = _loads(line)
+                        if not isinstance(record, dict):
+                            raise TypeError("record is not a JSON object")
+                        if record.get("op") == "del":
+                            lines = positions.get(tuple(record["key"]))
+                            self._tombstones += 1
+                            if lines:
+                                del live[lines.pop()]
+                        else:
+                            contact = Contact(**record)
+                            positions[contact.key()].append(number)
+                            live[number] = contact
+                    except (ValueError, TypeError, KeyError):
+                        bad_lines.append(number)
         except FileNotFoundError:
-            self.contacts = []
-        except json.JSONDecodeError:
+            live = {}
+        if bad_lines or not ends_with_newline:
+            self._rewrite_needed = True
+        for number in bad_lines:
+            print_in_color(f"Skipped unreadable line {number + 1} of the contacts file.", 'red')
+        self.contacts = list(live.values())
+        self._rebuild_indexes()
+        self._compact_if_needed()
+
+    def _load_legacy_contacts(self, file):
+        """
+        Loads contacts from a file in the former format, a single JSON array, and marks the file for conversion.
+        """
+        try:
+            self.contacts = [Contact(**data) for data in json.load(file)]
+        except (ValueError, TypeError):
             print_in_color("Error reading the contacts file.", 'red')
             self.contacts = []
+        self._rewrite_needed = True
+        self._rebuild_indexes()
+
+    def _rebuild_indexes(self):
+        """
+        Rebuilds the duplicate index, the search blobs and the display order from the loaded contacts.
+        """
+        self._keys = Counter(contact.key() for contact in self.contacts)
+        self._blobs = [contact._search_blob for contact in self.contacts]
+        self._sorted_dirty = True
+
+    def _forget_key(self, key):
+        """
+        Removes one occurrence of a contact key from the duplicate index.
+        """
+        self._keys[key] -= 1
+        if self._keys[key] <= 0:
+            del self._keys[key]
 
     def save_contacts(self):
         """
-        Saves contacts to the file.
+        Saves contacts to the file, rewriting it with one line per contact and no tombstones.
+
+        Inside a `buffered()` block the rewrite is deferred until the block ends.
+        """
+        if self._buffering:
+            self._dirty = True
+            self._pending = []
+            return
+        with open(self.filename, "w", encoding="utf-8") as file:
+            file.writelines(_dumps(contact.to_dict()) + "\n" for contact in self.contacts)
+        self._tombstones = 0
+        self._rewrite_needed = False
+
+    def _append_records(self, *records):
         """
-        with open(self.filename, "w") as file:
-            json.dump([contact.__dict__ for contact in self.contacts], file, indent=4)
+        Appends records (contacts or tombstones) to the end of the file, without rewriting it.
 
-    def get_valid_input(self, prompt, validation_func, error_message):
+        Inside a `buffered()` block the records are queued and written when the block ends. If the file could not
+        be fully read, it is rewritten from the contacts in memory instead, which already include the records.
+        """
+        if self._buffering:
+            if not self._dirty:
+                self._pending.extend(records)
+            return
+        if self._rewrite_needed:
+            self.save_contacts()
+            return
+        with open(self.filename, "a", encoding="utf-8") as file:
+            for record in records:
+                if record.get("op") == "del":
+                    self._tombstones += 1
+                file.write(_dumps(record) + "\n")
+        self._compact_if_needed()
+
+    @contextmanager
+    def buffered(self):
+        """
+        Defers writes to the file until the end of the block, so bulk changes touch the file only once.
+
+        Blocks can be nested; the pending changes are written when the outermost block exits.
+
+        Example usage:
+        --------------
+        >>> with manager.buffered():
+        ...     for first_name, last_name, phone_number, email in rows:
+        ...         manager.add_contact(first_name, last_name, phone_number, email)
+        """
+        self._buffering += 1
+        try:
+            yield self
+        finally:
+            self._buffering -= 1
+            if not self._buffering:
+                self._flush()
+
+    def _flush(self):
+        """
+        Writes the changes deferred by `buffered()`.
+        """
+        if self._dirty:
+            self._dirty = False
+            self.save_contacts()
+        elif self._pending:
+            records, self._pending = self._pending, []
+            self._append_records(*records)
+
+    def _compact_if_needed(self):
+        """
+        Rewrites the file when tombstones outnumber both the threshold and the live contacts.
+        """
+        if self._tombstones > max(_COMPACT_THRESHOLD, len(self.contacts)):
+            self.save_contacts()
+
+    def get_valid_input(self, prompt, validation_func, error_message, current_value=None):
         """
         Gets a valid input from the user based on the validation function.
+
+        If `current_value` is given, an empty input keeps it instead of being validated.
         """
         while True:
             value = input(prompt).strip()
+            if current_value is not None and value == "":
+                return current_value
             if validation_func(value):
                 return value
             else:
@@ -130,11 +395,58 @@ class ContactManager:
                 print_in_color("Contact not added.", 'red')
                 return
 
-        contact = Contact(first_name, last_name, phone_number, email)
-        self.contacts.append(contact)
-        self.save_contacts()
+        self._insert_contact(Contact(first_name, last_name, phone_number, email))
         print_in_color("Contact added successfully.", 'green')
 
+    def bulk_add(self, rows):
+        """
+        Adds many contacts at once, for example when importing them from a CSV file.
+
+        Unlike `add_contact`, this method never prompts the user: rows that are not exactly four strings, rows with
+        invalid details, and rows that duplicate an existing contact or an earlier row are skipped. The file is
+        written once, after all rows are added.
+
+        Parameters:
+        -----------
+        rows : iterable of sequences
+            The contacts to add, as (first_name, last_name, phone_number, email) tuples or lists, such as the
+            rows of a `csv.reader`.
+
+        Returns:
+        --------
+        int
+            The number of contacts added.
+
+        Example usage:
+        --------------
+        >>> manager.bulk_add([("John", "Doe", "+1234567890", "john.doe@example.com")])
+        1
+        """
+        added = 0
+        with self.buffered():
+            for row in rows:
+                if not isinstance(row, (tuple, list)) or len(row) != 4 or not all(isinstance(value, str) for value in row):
+                    continue
+                first_name, last_name, phone_number, email = row
+                if not (self._is_valid_name(first_name) and self._is_valid_name(last_name) and
+                        self._is_valid_phone(phone_number) and self._is_valid_email(email)):
+                    continue
+                if self._is_duplicate(first_name, last_name, phone_number, email):
+                    continue
+                self._insert_contact(Contact(first_name, last_name, phone_number, email))
+                added += 1
+        return added
+
+    def _insert_contact(self, contact):
+        """
+        Appends a contact to the list, updates the indexes and records it in the file.
+        """
+        self.contacts.append(contact)
+        self._blobs.append(contact._search_blob)
+        self._sorted_dirty = True
+        self._keys[contact.key()] += 1
+        self._append_records(contact.to_dict())
+
     def _is_valid_name(self, name):
         """
         Validates the name.
@@ -144,7 +456,8 @@ class ContactManager:
         bool
             True if the name is valid, False otherwise.
         """
-        return bool(re.match(r"^[A-Za-z\s]+$", name)) #This regex checks whether the string contained in the variable "name" consists                                                             exclusively of letters of the alphabet (both upper and lower case) and contains no                                                         other characters such as numbers, symbols ( blank spaces between the letters are                                                           allowed)
+        leftover = name.translate(_NAME_TABLE)
+        return bool(name) and (not leftover or leftover.isspace()) #The name must consist exclusively of letters of the alphabet (both upper and lower case) and blank spaces (including non-ASCII whitespace)
 
 
     def _is_valid_phone(self, phone):
@@ -157,7 +470,10 @@ class ContactManager:
             True if the phone number is valid, False otherwise.
         
         """
-        return bool(re.match(r"^\+?[0-9]*$", phone)) #This regex checks whether the string contained in the phone variable consists                                                            exclusively of numbers and optionally starts with a plus sign (+)
+        if phone.endswith('\n'):  #a single trailing newline is tolerated, as the former `$` anchor did
+            phone = phone[:-1]
+        digits = phone[1:] if phone.startswith('+') else phone
+        return not digits.translate(_PHONE_TABLE) #The phone number must consist exclusively of numbers and optionally start with a plus sign (+)
 
     def _is_valid_email(self, email):
         """
@@ -168,21 +484,30 @@ class ContactManager:
         bool
             True if the email is valid, False otherwise.
         """
-        return bool(re.match(r"^[\w\.-]+@[\w\.-]+\.\w+$", email)) #This regex checks whether the string contained in the email variable                                                                     corresponds to a standard email address format.
+        #split at the first '@' and the last '.' instead of matching a pattern with overlapping character classes,
+        #so the check runs in linear time whatever the input (no backtracking)
+        if email.endswith('\n'):  #a single trailing newline is tolerated, as the former `$` anchor did
+            email = email[:-1]
+        local, at, domain = email.partition('@')
+        host, dot, tld = domain.rpartition('.')
+        if not (local and at and host and dot and tld):
+            return False
+        #local part and host may contain letters, digits, underscores, dots and hyphens, the top-level domain only word characters
+        return all(_is_word(part.translate(table)) for part, table in ((local, _EMAIL_TABLE), (host, _EMAIL_TABLE), (tld, _TLD_TABLE)))
 
     def _is_duplicate(self, first_name, last_name, phone_number, email):
         """
         Checks if a contact is a duplicate.
+
+        The details are compared as one tuple against the key index, a single hashed lookup whatever the number
+        of contacts.
         
         Returns:
         --------
         bool
             True if the contact is a duplicate, False otherwise.
         """
-        return any(contact.first_name == first_name and 
-                   contact.last_name == last_name and 
-                   contact.phone_number == phone_number and 
-                   contact.email == email for contact in self.contacts)
+        return (first_name, last_name, phone_number, email) in self._keys
 
     def display_contacts(self):
         """
@@ -192,10 +517,12 @@ class ContactManager:
         if not self.contacts:
             print_in_color("No contacts available. Please, enter one.", 'red')
         else:
-            sorted_contacts = sorted(self.contacts, key=lambda contact: (contact.first_name, contact.last_name))
-            table_data = [[contact.first_name, contact.last_name, contact.phone_number, contact.email] for contact in sorted_contacts]
+            if self._sorted_dirty:
+                self._sorted_cache = sorted(self.contacts, key=lambda contact: (contact.first_name, contact.last_name))
+                self._sorted_dirty = False
+            table_data = [[contact.first_name, contact.last_name, contact.phone_number, contact.email] for contact in self._sorted_cache]
             headers = ["First Name", "Last Name", "Phone Number", "Email"]
-            print(tabulate(table_data, headers=headers, tablefmt="grid"))
+            print(render_table(table_data, headers))
 
     def modify_contact(self, query):
         """
@@ -225,11 +552,12 @@ class ContactManager:
         --------------
         >>> self.modify_contact("John Doe")
         """
-        results = self.search_contact(query, display=False)
+        results = self._find_contacts(query)
         if results:
-            contact = self._select_contact_from_results(results)
-            if not contact:
+            selected = self._select_contact_from_results(results)
+            if not selected:
                 return
+            index, contact = selected
 
             print("\nSelected contact to modify:")
             print(contact)
@@ -240,53 +568,17 @@ class ContactManager:
                 print_in_color("Modification cancelled.", 'red')
                 return
 
-            index = self.contacts.index(contact)
-
-            def get_new_value(prompt, validation_func, error_message, current_value):
-                """
-                Prompts the user for input and validates it based on the provided validation function.
-
-                This function repeatedly prompts the user to enter a value until a valid input is provided
-                or the user decides to keep the current value by entering an empty string. The input is 
-                validated using the provided validation function. If the input is invalid, an error message 
-                is displayed and the user is prompted again.
-
-                Parameters:
-                -----------
-                prompt : str
-                    The message displayed to the user when requesting input.
-                validation_func : function
-                    A function that takes a single string argument and returns a boolean indicating 
-                    whether the input is valid or not.
-                error_message : str
-                    The message displayed to the user when the input is invalid.
-                current_value : str
-                    The current value to keep if the user provides an empty input.
-
-                Returns:
-                --------
-                str
-                    The validated input provided by the user, or the current value if the input is empty.
-                """
-                new_value = input(prompt).strip()
-                if new_value == "":
-                    return current_value
-                elif not validation_func(new_value):
-                    print_in_color(error_message, 'red')
-                    return get_new_value(prompt, validation_func, error_message, current_value)
-                return new_value
-
-            first_name = get_new_value("Enter new first name (leave blank to keep current): ", self._is_valid_name, 
-                                      "Invalid first name. Only letters and spaces are allowed.", contact.first_name)
-
-            last_name = get_new_value("Enter new last name (leave blank to keep current): ", self._is_valid_name, 
-                                     "Invalid last name. Only letters and spaces are allowed.", contact.last_name)
-
-            phone_number = get_new_value("Enter new phone number (leave blank to keep current): ", self._is_valid_phone, 
-                                        "Invalid phone number. Only numbers and optionally a plus sign are allowed.",                                                             contact.phone_number)
-
-            email = get_new_value("Enter new email (leave blank to keep current): ", self._is_valid_email, 
-                                 "Invalid email. Please enter a valid email address.", contact.email)
+            first_name = self.get_valid_input("Enter new first name (leave blank to keep current): ", self._is_valid_name, 
+                                              "Invalid first name. Only letters and spaces are allowed.", contact.first_name)
+
+            last_name = self.get_valid_input("Enter new last name (leave blank to keep current): ", self._is_valid_name, 
+                                             "Invalid last name. Only letters and spaces are allowed.", contact.last_name)
+
+            phone_number = self.get_valid_input("Enter new phone number (leave blank to keep current): ", self._is_valid_phone, 
+                                                "Invalid phone number. Only numbers and optionally a plus sign are allowed.",                                                             contact.phone_number)
+
+            email = self.get_valid_input("Enter new email (leave blank to keep current): ", self._is_valid_email, 
+                                         "Invalid email. Please enter a valid email address.", contact.email)
 
             if self._is_duplicate(first_name, last_name, phone_number, email):
                 print_in_color("This contact already exists. Do you want to update it anyway? (y/n): ", 'red')
@@ -295,12 +587,18 @@ class ContactManager:
                     print_in_color("Modification cancelled due to duplicate contact.", 'red')
                     return
 
-            self.contacts[index].first_name = first_name
-            self.contacts[index].last_name = last_name
-            self.contacts[index].phone_number = phone_number
-            self.contacts[index].email = email
-
-            self.save_contacts()
+            old_key = contact.key()
+            contact.first_name = first_name
+            contact.last_name = last_name
+            contact.phone_number = phone_number
+            contact.email = email
+            contact._update_search_blob()
+            self._blobs[index] = contact._search_blob
+            self._sorted_dirty = True
+            self._forget_key(old_key)
+            self._keys[contact.key()] += 1
+
+            self._append_records({"op": "del", "key": list(old_key)}, contact.to_dict())
             print_in_color("Contact modified successfully.", 'green')
         else:
             print_in_color("No contacts found.", 'red')
@@ -308,9 +606,11 @@ class ContactManager:
     def _select_contact_from_results(self, results):
         """
         Helper function to select a contact from search results.
+
+        The results are (index, contact) pairs as returned by `_find_contacts`; the selected pair is returned.
         """
         if len(results) > 1:
-            for i, contact in enumerate(results):
+            for i, (_, contact) in enumerate(results):
                 print(f"{i + 1}: {contact}")
 
             while True:
@@ -347,11 +647,12 @@ class ContactManager:
         --------------
         >>> self.delete_contact("John Doe")
         """
-        results = self.search_contact(query, display=False)
+        results = self._find_contacts(query)
         if results:
-            contact = self._select_contact_from_results(results)
-            if not contact:
+            selected = self._select_contact_from_results(results)
+            if not selected:
                 return
+            index, contact = selected
 
             print("\nSelected contact to delete:")
             print(contact)
@@ -359,14 +660,25 @@ class ContactManager:
             print_in_color("Are you sure you want to delete this contact? (y/n): ", 'red')
             confirm = input().strip().lower()
             if confirm == 'y':
-                self.contacts.remove(contact)
-                self.save_contacts()
+                del self.contacts[index]
+                del self._blobs[index]
+                self._sorted_dirty = True
+                self._forget_key(contact.key())
+                self._append_records({"op": "del", "key": list(contact.key())})
                 print_in_color("Contact deleted successfully.", 'green')
             else:
                 print_in_color("Contact deletion cancelled.", 'red')
         else:
             print_in_color("No contacts found.", 'red')
 
+    def _find_contacts(self, query):
+        """
+        Returns the (index, contact) pairs of the contacts matching the query, case-insensitively.
+        """
+        query = query.lower()
+        contacts = self.contacts
+        return [(i, contacts[i]) for i, blob in enumerate(self._blobs) if query in blob]
+
     def search_contact(self, query, display=True):
         """
         Searches for contacts that match the specified query.
@@ -396,32 +708,99 @@ class ContactManager:
         >>> manager.search_contact("Smith", display=False)
         [Contact(first_name='Jane', last_name='Smith', phone_number='+0987654321', email='jane.smith@example.com')]
         """
-        query = query.lower()
-        results = [contact for contact in self.contacts if query in contact.first_name.lower() or 
-                                                       query in contact.last_name.lower() or 
-                                                       query in contact.phone_number or 
-                                                       query in contact.email.lower()]
+        results = [contact for _, contact in self._find_contacts(query)]
         if display:
             if results:
                 table_data = [[contact.first_name, contact.last_name, contact.phone_number, contact.email] for contact in results]
                 headers = ["First Name", "Last Name", "Phone Number", "Email"]
-                print(tabulate(table_data, headers=headers, tablefmt="grid"))
+                print(render_table(table_data, headers))
             else:
                 print_in_color("No contacts found.", 'red')
         return results
 
+    def bulk_search(self, queries):
+        """
+        Searches for the contacts matching each of several queries.
+
+        Matching follows the same case-insensitive rules as `search_contact`. When pyahocorasick is installed,
+        all the queries are compiled into a single Aho-Corasick automaton and the contacts are scanned once,
+        instead of once per query.
+
+        Parameters:
+        -----------
+        queries : iterable of str
+            The strings to search for within the contact details.
+
+        Returns:
+        --------
+        dict
+            A dictionary mapping each query to the list of `Contact` objects that match it.
+
+        Example usage:
+        --------------
+        >>> matches = manager.bulk_search(["john", "smith"])
+        >>> matches["smith"]
+        [Contact(first_name='Jane', last_name='Smith', phone_number='+0987654321', email='jane.smith@example.com')]
+        """
+        queries = list(dict.fromkeys(queries))
+        results = {query: [] for query in queries}
+        needles = {}  # lowercase query -> original queries
+        for query in queries:
+            needles.setdefault(query.lower(), []).append(query)
+
+        if ahocorasick is None or len(needles) < 2:
+            for needle, originals in needles.items():
+                matches = [contact for contact, blob in zip(self.contacts, self._blobs) if needle in blob]
+                for query in originals:
+                    results[query] = list(matches)
+            return results
+
+        #the empty string is a substring of every blob but cannot be added to the automaton
+        everyone = needles.pop("", [])
+        for query in everyone:
+            results[query] = list(self.contacts)
+
+        automaton = ahocorasick.Automaton()
+        for needle in needles:
+            automaton.add_word(needle, needle)
+        automaton.make_automaton()
+        for contact, blob in zip(self.contacts, self._blobs):
+            for needle in {needle for _, needle in automaton.iter(blob)}:
+                for query in needles[needle]:
+                    results[query].append(contact)
+        return results
+
+
+def render_table(rows, headers):
+    """
+    Formats rows of strings as a grid table, with the headers on top and every cell left-aligned.
+    """
+    widths = [len(header) for header in headers]
+    for row in rows:
+        for i, cell in enumerate(row):
+            if len(cell) > widths[i]:
+                widths[i] = len(cell)
+    border = "+" + "+".join("-" * (width + 2) for width in widths) + "+"
+    header_border = "+" + "+".join("=" * (width + 2) for width in widths) + "+"
+
+    def format_row(row):
+        return "| " + " | ".join(cell.ljust(width) for cell, width in zip(row, widths)) + " |"
+
+    lines = [border, format_row(headers), header_border]
+    for row in rows:
+        lines.append(format_row(row))
+        lines.append(border)
+    return "\n".join(lines)
+
 
 def print_in_color(text, color):
     """
     Print the given text in the specified colour.
     """
-    color_map = {
-        'yellow': Fore.YELLOW,
-        'red': Fore.RED,
-        'green': Fore.GREEN,
-        'blue': Fore.BLUE,
-    }
-    color_code = color_map.get(color, Fore.RESET)  # Set default colour if not found
+    if not _USE_COLOR:
+        print(text)
+        return
+    color_code = _COLOR_MAP.get(color, Fore.RESET)  # Set default colour if not found
     print(color_code + text + Fore.RESET)
     
     
@@ -451,7 +830,7 @@ def main():
     Notes:
     ------
     - The function relies on the existence of a `ContactManager` class that handles the core functionality of contact management.
-    - The program checks if the contact data file (`contacts.json`) exists before allowing modification, deletion, or search operations.
+    - The program checks that at least one contact has been loaded or added before allowing modification, deletion, or search operations.
     - User inputs are validated, and appropriate messages are displayed for invalid choices or empty contact lists.
 
     Example usage:
@@ -469,18 +848,7 @@ def main():
     manager = ContactManager()
         
     while True:
-        print_in_color("\n" + "="*45, 'yellow')
-        print_in_color("   ContactEase - Contact Management System", 'yellow')
-        print_in_color("="*45, 'yellow')
-        print_in_color("1. Add Contact", 'yellow')
-        print_in_color("2. View Contacts", 'yellow')
-        print_in_color("3. Modify Contact", 'yellow')
-        print_in_color("4. Delete Contact", 'yellow')
-        print_in_color("5. Search Contact", 'yellow')
-        print_in_color("6. Exit", 'yellow')
-        print_in_color("="*45, 'yellow')
-
-        print_in_color("Enter your choice (1-6): ", 'yellow')
+        print(_MENU)
         choice = input().strip()
 
         if choice == '1':
@@ -490,19 +858,19 @@ def main():
             print("\nDisplaying all contacts:")
             manager.display_contacts()
         elif choice == '3':
-            if os.path.exists("contacts.json"):
+            if manager.contacts:
                 query = input("Enter the name, phone number, or email of the contact to modify: ").strip()
                 manager.modify_contact(query)
             else:
                 print_in_color("No contacts found. Please add a contact first.", 'red')
         elif choice == '4':
-            if os.path.exists("contacts.json"):
+            if manager.contacts:
                 query = input("Enter the name, phone number, or email of the contact to delete: ").strip()
                 manager.delete_contact(query)
             else:
                 print_in_color("No contacts found. Please add a contact first.", 'red')
         elif choice == '5':
-            if os.path.exists("contacts.json"):
+            if manager.contacts:
                 query = input("Enter the name, phone number, or email of the contact to search: ").strip()
                 manager.search_contact(query)
             else: